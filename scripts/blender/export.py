@@ -1,99 +1,172 @@
+"""
+Blender conversion script.
+
+Runs in two modes:
+  - Single-shot (default): convert the file described by the environment
+    variables below, then exit. This is the classic spawn-per-file mode.
+  - Worker mode (BLENDER_WORKER_MODE=1): read one JSON job per line from
+    stdin and emit one JSON result per line on stdout (prefixed with
+    "[BlenderWorker]"), amortizing Blender startup, scene reset and
+    addon registration across many conversions.
+
+Environment Variables (single-shot mode):
+    INPUT_FILE_PATH / INPUT_FILE_FORMAT: Input file and its format
+    OUTPUT_FILE_PATH / OUTPUT_FILE_FORMAT: Output file and its format
+    DECIMATE_TARGET_FACES: Optional face budget for mesh decimation
+"""
+
 import bpy
 import sys
 import os
 import re
+import json
+import shutil
+import hashlib
 
-# read from environment variables
-output_file_path = os.environ["OUTPUT_FILE_PATH"]
-output_file_format = os.environ["OUTPUT_FILE_FORMAT"]
-input_file_path = os.environ["INPUT_FILE_PATH"]
-input_file_format = os.environ["INPUT_FILE_FORMAT"]
+# Prefix marking machine-readable worker result lines on stdout
+WORKER_RESULT_PREFIX = "[BlenderWorker] "
 
-#--------------------------------------------------------------------
-# Reset to factory settings FIRST
-#--------------------------------------------------------------------
-bpy.ops.wm.read_factory_settings(use_empty=True)
+# Binary DXF files start with this exact 22-byte sentinel
+BINARY_DXF_SENTINEL = b'AutoCAD Binary DXF\r\n\x1a\x00'
 
-#--------------------------------------------------------------------
-# Enable Plugins AFTER reset
-#--------------------------------------------------------------------
-from addon_utils import check, enable
+# Number of cached .blend imports to keep (oldest evicted first)
+BLEND_CACHE_MAX_ENTRIES = int(os.environ.get("BLENDER_IMPORT_CACHE_ENTRIES", "32"))
 
-# Enable required addons
-addons_to_enable = ["io_scene_gltf2"]
 
-# Add DXF exporter if DXF output is requested
-if output_file_format == "dxf":
-    addons_to_enable.append("io_export_dxf")
+def blend_cache_path(input_file_path, input_file_format):
+  """
+  Map an input file to its cached post-import .blend path.
 
-for addon in addons_to_enable:
-    try:
-        default, enabled = check(addon)
-        if not enabled:
-            enable(addon, default_set=True, persistent=True)
-            print(f"[Blender] Enabled addon: {addon}")
-    except Exception as e:
-        print(f"[Blender] Warning: Could not enable addon {addon}: {e}")
+  Keyed by SHA-256 of the input bytes plus the format, so converting the
+  same input to several output formats only pays the import cost once.
+  Returns None when caching is disabled via an empty
+  BLENDER_IMPORT_CACHE_DIR.
+  """
+  cache_dir = os.environ.get("BLENDER_IMPORT_CACHE_DIR", "/tmp/blender-import-cache")
+  if not cache_dir:
+    return None
 
-#--------------------------------------------------------------------
-# Sanity Checks
-#--------------------------------------------------------------------
+  digest = hashlib.sha256()
+  with open(input_file_path, 'rb') as f:
+    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+      digest.update(chunk)
+  digest.update(f":{input_file_format}".encode())
 
-if input_file_format == output_file_format:
-  print("[Blender] Warning: Same format input/output")
+  return os.path.join(cache_dir, digest.hexdigest() + ".blend")
 
-print(f"[Blender] Converting: {input_file_format} → {output_file_format}")
-print(f"[Blender] Input: {input_file_path}")
-print(f"[Blender] Output: {output_file_path}")
 
-#--------------------------------------------------------------------
-# Load 3D File from path
-#--------------------------------------------------------------------
+def evict_blend_cache(cache_dir):
+  """Keep the newest BLEND_CACHE_MAX_ENTRIES cache files, drop the rest."""
+  try:
+    entries = [
+      os.path.join(cache_dir, name)
+      for name in os.listdir(cache_dir)
+      if name.endswith(".blend")
+    ]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for stale in entries[BLEND_CACHE_MAX_ENTRIES:]:
+      os.remove(stale)
+      print(f"[Blender] Evicted import cache entry: {stale}")
+  except OSError as e:
+    print(f"[Blender] Warning: Import cache eviction failed: {e}")
 
-if input_file_format == "obj":
-  # Import OBJ - missing MTL warnings are normal and don't prevent import
-  # use_split_groups=True: Import each OBJ 'g' (group) as a separate Blender object
-  bpy.ops.wm.obj_import(filepath=input_file_path, use_split_groups=True)
-elif input_file_format == "stl":
-  bpy.ops.wm.stl_import(filepath=input_file_path)
-elif input_file_format == "ply":
-  bpy.ops.wm.ply_import(filepath=input_file_path)
-elif input_file_format == "fbx":
-  bpy.ops.import_scene.fbx(filepath=input_file_path)
-elif input_file_format in ("gltf", "glb"):
-  bpy.ops.import_scene.gltf(filepath=input_file_path)
-elif input_file_format == "dae":
-  bpy.ops.wm.collada_import(filepath=input_file_path)
-elif input_file_format == "3ds":
-  bpy.ops.import_scene.autodesk_3ds(filepath=input_file_path)
-elif input_file_format == "dxf":
-  # Check if it's a binary DXF (not supported by Blender)
-  with open(input_file_path, 'rb') as f:
-    header = f.read(22)
-    if b'AutoCAD Binary DXF' in header:
-      print("[Blender] ERROR: Binary DXF format not supported. Convert to ASCII DXF first.")
-      sys.exit(1)
-  
-  # Enable DXF importer
-  enable("io_import_dxf", default_set=True, persistent=True)
+
+class ConversionError(Exception):
+  """A conversion step failed; maps to exit code 1 in single-shot mode."""
+
+
+def reset_scene():
+  """
+  Load an empty scene without resetting preferences.
+
+  read_homefile keeps the in-memory preferences, so addons enabled via
+  the --addons CLI flag (or by an earlier worker job) stay registered —
+  a factory reset would disable them again and force full re-registration
+  on every conversion.
+  """
+  bpy.ops.wm.read_homefile(use_empty=True)
+
+  # A headless converter never undoes anything: drop undo bookkeeping and
+  # the sequencer/movie memory cache so every operator call skips that
+  # overhead. Idempotent and cheap, so simply re-applied per reset.
   try:
-    result = bpy.ops.import_scene.dxf(filepath=input_file_path)
-    if result != {'FINISHED'}:
-      print(f"[Blender] ERROR: DXF import returned {result}")
-      sys.exit(1)
+    prefs = bpy.context.preferences
+    prefs.edit.use_global_undo = False
+    prefs.edit.undo_steps = 0
+    prefs.system.memory_cache_limit = 0
   except Exception as e:
-    print(f"[Blender] ERROR: DXF import failed: {e}")
-    sys.exit(1)
-else:
-  print(f"[Blender] ERROR: Unsupported input format: {input_file_format}")
-  sys.exit(1)
+    print(f"[Blender] Warning: Could not tune preferences: {e}")
+
 
-# Verify objects were imported
-if len(bpy.data.objects) == 0:
-  print("[Blender] ERROR: No objects imported")
-  sys.exit(1)
+def enable_addons(addons_to_enable):
+  """
+  Enable the given addons for this session only.
+
+  The Node caller normally pre-enables addons via Blender's --addons CLI
+  flag, making this a cheap no-op fallback. Enabling without default_set
+  avoids rewriting userprefs on every invocation.
+  """
+  from addon_utils import check, enable
+
+  for addon in addons_to_enable:
+    try:
+      default, enabled = check(addon)
+      if not enabled:
+        enable(addon)
+        print(f"[Blender] Enabled addon: {addon}")
+    except Exception as e:
+      print(f"[Blender] Warning: Could not enable addon {addon}: {e}")
+
+
+def import_file(input_file_path, input_file_format):
+  """Import the input file into the current (empty) scene."""
+  # Fail fast on empty inputs instead of running a full import attempt
+  if os.path.getsize(input_file_path) == 0:
+    raise ConversionError(f"Input file is empty: {input_file_path}")
+
+  if input_file_format == "obj":
+    # Import OBJ - missing MTL warnings are normal and don't prevent import
+    # use_split_groups=True: Import each OBJ 'g' (group) as a separate Blender object
+    bpy.ops.wm.obj_import(filepath=input_file_path, use_split_groups=True)
+  elif input_file_format == "stl":
+    bpy.ops.wm.stl_import(filepath=input_file_path)
+  elif input_file_format == "ply":
+    bpy.ops.wm.ply_import(filepath=input_file_path)
+  elif input_file_format == "fbx":
+    bpy.ops.import_scene.fbx(filepath=input_file_path)
+  elif input_file_format in ("gltf", "glb"):
+    bpy.ops.import_scene.gltf(filepath=input_file_path)
+  elif input_file_format == "dae":
+    bpy.ops.wm.collada_import(filepath=input_file_path)
+  elif input_file_format == "3ds":
+    bpy.ops.import_scene.autodesk_3ds(filepath=input_file_path)
+  elif input_file_format == "dxf":
+    # Check if it's a binary DXF (not supported by Blender); the sentinel
+    # sits at offset 0, so a prefix compare beats a substring scan
+    with open(input_file_path, 'rb') as f:
+      header = f.read(len(BINARY_DXF_SENTINEL))
+    if header.startswith(BINARY_DXF_SENTINEL):
+      raise ConversionError("Binary DXF format not supported. Convert to ASCII DXF first.")
+
+    # Enable DXF importer (no-op when pre-enabled via --addons)
+    enable_addons(["io_import_dxf"])
+    try:
+      result = bpy.ops.import_scene.dxf(filepath=input_file_path)
+      if result != {'FINISHED'}:
+        raise ConversionError(f"DXF import returned {result}")
+    except ConversionError:
+      raise
+    except Exception as e:
+      raise ConversionError(f"DXF import failed: {e}")
+  else:
+    raise ConversionError(f"Unsupported input format: {input_file_format}")
+
+  # Verify objects were imported
+  if len(bpy.data.objects) == 0:
+    raise ConversionError("No objects imported")
+
+  print(f"[Blender] Imported {len(bpy.data.objects)} objects")
 
-print(f"[Blender] Imported {len(bpy.data.objects)} objects")
 
 #--------------------------------------------------------------------
 # Build Hierarchy from Colon Notation (Obj.XXX:1 → child of Obj.XXX)
@@ -109,10 +182,10 @@ def apply_colon_hierarchy():
   # Build a mapping of base names (without colon suffix) to their objects
   base_to_objects = {}  # base_name -> list of (suffix, object)
   parent_candidates = {}  # base_name -> parent object (without colon)
-  
+
   for obj in list(bpy.data.objects):
     name = obj.name
-    
+
     # Check for colon notation: Obj.195:1 or ComponentName_195:1
     colon_match = re.match(r'^(.+):(\d+)$', name)
     if colon_match:
@@ -126,18 +199,18 @@ def apply_colon_hierarchy():
       # Check if it matches Obj.XXX or ends with _XXX pattern
       if re.match(r'^Obj\.\d+$', name) or re.search(r'_\d+$', name):
         parent_candidates[name] = obj
-  
+
   if not base_to_objects:
     print("[Blender] No colon-notation objects found for hierarchy grouping")
     return 0
-  
+
   # Now create parent-child relationships
   parented_count = 0
-  
+
   for base_name, children_list in base_to_objects.items():
     # Find or create the parent object
     parent_obj = parent_candidates.get(base_name)
-    
+
     if parent_obj is None:
       # Parent doesn't exist as a geometry object, create an empty
       clean_name = base_name
@@ -147,7 +220,7 @@ def apply_colon_hierarchy():
       bpy.context.scene.collection.objects.link(empty)
       parent_obj = empty
       print(f"[Blender] Created empty parent: {clean_name}")
-    
+
     # Parent all children to this parent
     for suffix, child_obj in children_list:
       if child_obj.parent != parent_obj:
@@ -157,121 +230,244 @@ def apply_colon_hierarchy():
         # Restore world position (keep in place)
         child_obj.matrix_world = world_matrix
         parented_count += 1
-  
+
   return parented_count
 
-# Apply colon-based hierarchy for OBJ imports
-if input_file_format == "obj":
-  parented = apply_colon_hierarchy()
-  if parented > 0:
-    print(f"[Blender] Applied {parented} colon-notation parent-child relationships")
 
-#--------------------------------------------------------------------
-# Optional Mesh Decimation (for STEP pipeline - reduces FreeCAD memory)
-#--------------------------------------------------------------------
-decimate_target = os.environ.get("DECIMATE_TARGET_FACES", "")
-if decimate_target:
-  target = int(decimate_target)
+def decimate_meshes(target):
+  """
+  Optional mesh decimation (for STEP pipeline - reduces FreeCAD memory).
+  """
   mesh_objects = [obj for obj in bpy.data.objects if obj.type == 'MESH' and len(obj.data.polygons) > 0]
   total_faces = sum(len(obj.data.polygons) for obj in mesh_objects)
   if total_faces > target:
     print(f"[Blender] Decimating: {total_faces} → ~{target} faces across {len(mesh_objects)} objects")
-    
+
     # Join all meshes into one object first for uniform decimation
     # This avoids crashing on small objects with aggressive ratios
     bpy.ops.object.select_all(action='DESELECT')
     for obj in mesh_objects:
       obj.select_set(True)
     bpy.context.view_layer.objects.active = mesh_objects[0]
-    
+
     if len(mesh_objects) > 1:
       bpy.ops.object.join()
       print(f"[Blender] Joined {len(mesh_objects)} objects into one mesh")
-    
+
     combined = bpy.context.view_layer.objects.active
     combined_faces = len(combined.data.polygons)
     ratio = max(target / combined_faces, 0.01)
     print(f"[Blender] Combined mesh: {combined_faces} faces, applying ratio={ratio:.4f}")
-    
+
     mod = combined.modifiers.new("Decimate", 'DECIMATE')
     mod.ratio = ratio
     bpy.ops.object.modifier_apply(modifier="Decimate")
-    
+
     new_total = len(combined.data.polygons)
     print(f"[Blender] After decimation: {new_total} faces")
   else:
     print(f"[Blender] Mesh is small enough ({total_faces} faces), skipping decimation")
 
-#--------------------------------------------------------------------
-# Export 3D File
-#--------------------------------------------------------------------
 
-print(f"[Blender] Exporting to {output_file_format}...")
-
-if output_file_format == "fbx":
-  bpy.ops.export_scene.fbx(
-    filepath=output_file_path,
-    axis_forward="-Z",
-    axis_up="Y",
-    object_types={'MESH', 'EMPTY'},
-    add_leaf_bones=False,
-    bake_anim=False,
-  )
-elif output_file_format == "obj":
-  # Blender 4.0 uses wm.obj_export instead of export_scene.obj
-  bpy.ops.wm.obj_export(filepath=output_file_path)
-elif output_file_format == "stl":
-  # Blender 4.0 uses export_mesh.stl (not wm.stl_export)
-  bpy.ops.export_mesh.stl(filepath=output_file_path, use_selection=False, ascii=False)
-elif output_file_format == "ply":
-  bpy.ops.wm.ply_export(filepath=output_file_path)
-elif output_file_format == "glb":
-  bpy.ops.export_scene.gltf(filepath=output_file_path, export_format="GLB")
-elif output_file_format == "gltf":
-  # Blender 4.0 removed GLTF_EMBEDDED; use GLTF_SEPARATE then embed .bin as base64 data URI
-  gltf_base = os.path.splitext(output_file_path)[0]
-  bpy.ops.export_scene.gltf(filepath=output_file_path, export_format="GLTF_SEPARATE")
-  bin_path = gltf_base + ".bin"
-  if os.path.exists(bin_path) and os.path.exists(output_file_path):
-    import json, base64
-    with open(bin_path, "rb") as bf:
-      bin_data = bf.read()
-    with open(output_file_path, "r") as gf:
-      gltf_json = json.load(gf)
-    # Replace external buffer URI with embedded base64 data URI
-    if "buffers" in gltf_json:
-      for buf in gltf_json["buffers"]:
-        if "uri" in buf:
-          buf["uri"] = "data:application/octet-stream;base64," + base64.b64encode(bin_data).decode("ascii")
-    with open(output_file_path, "w") as gf:
-      json.dump(gltf_json, gf)
-    os.remove(bin_path)
-    print(f"[Blender] Embedded .bin into .gltf as base64 data URI")
-elif output_file_format == "dae":
-  bpy.ops.wm.collada_export(filepath=output_file_path)
-elif output_file_format == "3ds":
-  bpy.ops.export_scene.autodesk_3ds(filepath=output_file_path)
-elif output_file_format == "dxf":
-  bpy.ops.export.dxf(
-    filepath=output_file_path,
-    projectionThrough="NO",
-    onlySelected=False,
-    apply_modifiers=True,
-    mesh_as="3DFACEs",
-    entitylayer_from="obj.data.name",
-    entitycolor_from="default_COLOR",
-    entityltype_from="CONTINUOUS",
-    layerName_from="LAYERNAME_DEF",
-    verbose=True
-  )
-else:
-  print(f"[Blender] ERROR: Unsupported output format: {output_file_format}")
-  sys.exit(1)
-
-# Verify output file was created
-if os.path.exists(output_file_path):
-  file_size = os.path.getsize(output_file_path)
-  print(f"[Blender] Export complete: {output_file_path} ({file_size} bytes)")
-else:
-  print(f"[Blender] ERROR: Output file was not created: {output_file_path}")
-  sys.exit(1)
\ No newline at end of file
+def export_file(output_file_path, output_file_format):
+  """Export the current scene to the output file."""
+  print(f"[Blender] Exporting to {output_file_format}...")
+
+  if output_file_format == "fbx":
+    bpy.ops.export_scene.fbx(
+      filepath=output_file_path,
+      axis_forward="-Z",
+      axis_up="Y",
+      object_types={'MESH', 'EMPTY'},
+      add_leaf_bones=False,
+      bake_anim=False,
+    )
+  elif output_file_format == "obj":
+    # Blender 4.0 uses wm.obj_export instead of export_scene.obj
+    bpy.ops.wm.obj_export(filepath=output_file_path)
+  elif output_file_format == "stl":
+    # Blender 4.0 uses export_mesh.stl (not wm.stl_export)
+    bpy.ops.export_mesh.stl(filepath=output_file_path, use_selection=False, ascii=False)
+  elif output_file_format == "ply":
+    bpy.ops.wm.ply_export(filepath=output_file_path)
+  elif output_file_format == "glb":
+    bpy.ops.export_scene.gltf(filepath=output_file_path, export_format="GLB")
+  elif output_file_format == "gltf":
+    # Blender 4.0 removed GLTF_EMBEDDED; use GLTF_SEPARATE then embed .bin as base64 data URI
+    gltf_base = os.path.splitext(output_file_path)[0]
+    bpy.ops.export_scene.gltf(filepath=output_file_path, export_format="GLTF_SEPARATE")
+    bin_path = gltf_base + ".bin"
+    if os.path.exists(bin_path) and os.path.exists(output_file_path):
+      import base64
+      with open(bin_path, "rb") as bf:
+        bin_data = bf.read()
+      with open(output_file_path, "r") as gf:
+        gltf_json = json.load(gf)
+      # Replace external buffer URI with embedded base64 data URI
+      if "buffers" in gltf_json:
+        for buf in gltf_json["buffers"]:
+          if "uri" in buf:
+            buf["uri"] = "data:application/octet-stream;base64," + base64.b64encode(bin_data).decode("ascii")
+      with open(output_file_path, "w") as gf:
+        json.dump(gltf_json, gf)
+      os.remove(bin_path)
+      print(f"[Blender] Embedded .bin into .gltf as base64 data URI")
+  elif output_file_format == "dae":
+    bpy.ops.wm.collada_export(filepath=output_file_path)
+  elif output_file_format == "3ds":
+    bpy.ops.export_scene.autodesk_3ds(filepath=output_file_path)
+  elif output_file_format == "dxf":
+    bpy.ops.export.dxf(
+      filepath=output_file_path,
+      projectionThrough="NO",
+      onlySelected=False,
+      apply_modifiers=True,
+      mesh_as="3DFACEs",
+      entitylayer_from="obj.data.name",
+      entitycolor_from="default_COLOR",
+      entityltype_from="CONTINUOUS",
+      layerName_from="LAYERNAME_DEF",
+      verbose=True
+    )
+  else:
+    raise ConversionError(f"Unsupported output format: {output_file_format}")
+
+  # Verify output file was created
+  if os.path.exists(output_file_path):
+    file_size = os.path.getsize(output_file_path)
+    print(f"[Blender] Export complete: {output_file_path} ({file_size} bytes)")
+  else:
+    raise ConversionError(f"Output file was not created: {output_file_path}")
+
+
+def convert(input_file_path, input_file_format, output_file_path, output_file_format,
+            decimate_target_faces=None):
+  """Run one import → (optional decimate) → export conversion."""
+  # Enable required addons (cheap no-op when already enabled)
+  addons_to_enable = ["io_scene_gltf2"]
+  if output_file_format == "dxf":
+    addons_to_enable.append("io_export_dxf")
+  enable_addons(addons_to_enable)
+
+  if input_file_format == output_file_format and not decimate_target_faces:
+    # Same-format "conversion" is just a copy; skip the import/export
+    # pipeline entirely. Decimation requests (e.g. the STL→STL sanitize
+    # step of the mesh→STEP pipeline) still go through Blender.
+    shutil.copyfile(input_file_path, output_file_path)
+    print(f"[Blender] Copy passthrough: {output_file_path} ({os.path.getsize(output_file_path)} bytes)")
+    return
+
+  print(f"[Blender] Converting: {input_file_format} → {output_file_format}")
+  print(f"[Blender] Input: {input_file_path}")
+  print(f"[Blender] Output: {output_file_path}")
+
+  # The post-import scene is cached as a .blend keyed by the input bytes,
+  # so converting one input to several output formats imports only once
+  cache_path = None
+  try:
+    cache_path = blend_cache_path(input_file_path, input_file_format)
+  except OSError as e:
+    print(f"[Blender] Warning: Could not hash input for import cache: {e}")
+
+  loaded_from_cache = False
+  if cache_path and os.path.exists(cache_path):
+    try:
+      bpy.ops.wm.open_mainfile(filepath=cache_path, load_ui=False)
+      os.utime(cache_path, None)  # refresh LRU timestamp
+      loaded_from_cache = True
+      print(f"[Blender] Import cache hit ({len(bpy.data.objects)} objects)")
+    except Exception as e:
+      print(f"[Blender] Warning: Could not load import cache: {e}")
+
+  if not loaded_from_cache:
+    import_file(input_file_path, input_file_format)
+
+    # Apply colon-based hierarchy for OBJ imports
+    if input_file_format == "obj":
+      parented = apply_colon_hierarchy()
+      if parented > 0:
+        print(f"[Blender] Applied {parented} colon-notation parent-child relationships")
+
+    if cache_path:
+      try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write via a per-process temp file so concurrent jobs on the
+        # same input never expose a half-written .blend to readers
+        tmp_path = cache_path + f".{os.getpid()}.tmp"
+        bpy.ops.wm.save_as_mainfile(filepath=tmp_path, copy=True)
+        os.replace(tmp_path, cache_path)
+        evict_blend_cache(os.path.dirname(cache_path))
+        print(f"[Blender] Import cached: {cache_path}")
+      except Exception as e:
+        print(f"[Blender] Warning: Could not write import cache: {e}")
+
+  if decimate_target_faces:
+    decimate_meshes(int(decimate_target_faces))
+
+  export_file(output_file_path, output_file_format)
+
+
+def run_single_shot():
+  """Classic mode: one conversion driven by environment variables."""
+  # read from environment variables
+  output_file_path = os.environ["OUTPUT_FILE_PATH"]
+  output_file_format = os.environ["OUTPUT_FILE_FORMAT"]
+  input_file_path = os.environ["INPUT_FILE_PATH"]
+  input_file_format = os.environ["INPUT_FILE_FORMAT"]
+  decimate_target_faces = os.environ.get("DECIMATE_TARGET_FACES", "") or None
+
+  # Start from an empty scene FIRST
+  reset_scene()
+
+  try:
+    convert(input_file_path, input_file_format, output_file_path, output_file_format,
+            decimate_target_faces)
+  except ConversionError as e:
+    print(f"[Blender] ERROR: {e}")
+    sys.exit(1)
+
+
+def run_worker():
+  """
+  Persistent worker: read one JSON job per stdin line, convert, and write
+  one JSON result line prefixed with WORKER_RESULT_PREFIX. The scene is
+  reset between jobs but addons stay enabled, so the multi-second Blender
+  startup cost is paid once per worker instead of once per file.
+  """
+  reset_scene()
+  # Pre-enable everything any job might need so per-job enabling is a no-op
+  enable_addons(["io_scene_gltf2", "io_export_dxf", "io_import_dxf"])
+
+  print(WORKER_RESULT_PREFIX + json.dumps({"ready": True}), flush=True)
+
+  for line in sys.stdin:
+    line = line.strip()
+    if not line:
+      continue
+
+    try:
+      job = json.loads(line)
+      convert(
+        job["input_file_path"],
+        job["input_file_format"],
+        job["output_file_path"],
+        job["output_file_format"],
+        job.get("decimate_target_faces"),
+      )
+      result = {"ok": True, "output": job["output_file_path"]}
+    except ConversionError as e:
+      result = {"ok": False, "error": str(e)}
+    except Exception as e:
+      result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    print(WORKER_RESULT_PREFIX + json.dumps(result), flush=True)
+
+    # Clear the scene for the next job (addons persist across resets)
+    reset_scene()
+
+
+if __name__ == "__main__":
+  if os.environ.get("BLENDER_WORKER_MODE") == "1":
+    run_worker()
+  else:
+    run_single_shot()
@@ -35,6 +35,38 @@ import FreeCAD
 import Part
 importDXF = None  # Lazy-loaded only when needed for DXF operations
 
+# Extension aliases that denote the same on-disk format
+FORMAT_ALIASES = {".stp": ".step", ".igs": ".iges"}
+
+
+def log(message):
+    """
+    Write a progress line to stderr and flush immediately.
+
+    stderr keeps progress separate from any stdout protocol and, being
+    unbuffered, parallel workers sharing a pipe don't interleave partial
+    lines.
+    """
+    sys.stderr.write(message + "\n")
+    sys.stderr.flush()
+
+
+def configure_step_reader():
+    """
+    Tune FreeCAD's STEP reader for headless conversion.
+
+    ReadShapeCompoundMode makes Part.insert produce a single compound
+    document object instead of one object per sub-shape, skipping a lot
+    of per-object document overhead on large assemblies. Link groups are
+    a GUI/assembly feature this pipeline never uses.
+    """
+    try:
+        params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Import")
+        params.SetBool("ReadShapeCompoundMode", True)
+        params.SetBool("UseLinkGroup", False)
+    except Exception as e:
+        log(f"[FreeCAD] Warning: Could not configure STEP reader: {e}")
+
 
 def load_cad_file(file_path, doc):
     """
@@ -49,7 +81,7 @@ def load_cad_file(file_path, doc):
     """
     ext = os.path.splitext(file_path)[1].lower()
     
-    print(f"[FreeCAD] Loading {ext.upper()} file...")
+    log(f"[FreeCAD] Loading {ext.upper()} file...")
     
     if ext == ".dxf":
         # DXF requires special importer (lazy import to avoid PySide dependency)
@@ -60,6 +92,7 @@ def load_cad_file(file_path, doc):
         # importDXF.open creates a new document, get the active one
         doc = FreeCAD.ActiveDocument
     elif ext in (".step", ".stp"):
+        configure_step_reader()
         Part.insert(file_path, doc.Name)
     elif ext in (".iges", ".igs"):
         # Try Part.insert first, fall back to Part.open and direct shape read
@@ -74,42 +107,42 @@ def load_cad_file(file_path, doc):
     if doc is None:
         raise RuntimeError("No document created after import")
 
-    # Collect all shapes
-    shapes = []
-    for obj in doc.Objects:
-        if hasattr(obj, "Shape") and obj.Shape:
-            if not obj.Shape.isNull():
-                shapes.append(obj.Shape)
+    # Collect all shapes via the C++-side typed filter (avoids the
+    # per-object Python attribute scan on large documents)
+    shapes = [
+        obj.Shape for obj in doc.findObjects(Type="Part::Feature")
+        if not obj.Shape.isNull()
+    ]
 
     # For IGES: if Part.insert found no shapes, try reading the shape directly
     if not shapes and ext in (".iges", ".igs"):
-        print(f"[FreeCAD] Part.insert found no shapes, trying direct Part.Shape.read...")
+        log(f"[FreeCAD] Part.insert found no shapes, trying direct Part.Shape.read...")
         try:
             shape = Part.Shape()
             shape.read(file_path)
             if not shape.isNull():
                 shapes.append(shape)
-                print(f"[FreeCAD] Direct shape read succeeded")
+                log(f"[FreeCAD] Direct shape read succeeded")
         except Exception as e:
-            print(f"[FreeCAD] Direct shape read failed: {e}")
+            log(f"[FreeCAD] Direct shape read failed: {e}")
 
         # If still no shapes, try Part.open (creates new document)
         if not shapes:
-            print(f"[FreeCAD] Trying Part.open...")
+            log(f"[FreeCAD] Trying Part.open...")
             try:
                 Part.open(file_path)
                 doc = FreeCAD.ActiveDocument
-                for obj in doc.Objects:
-                    if hasattr(obj, "Shape") and obj.Shape:
-                        if not obj.Shape.isNull():
-                            shapes.append(obj.Shape)
+                shapes.extend(
+                    obj.Shape for obj in doc.findObjects(Type="Part::Feature")
+                    if not obj.Shape.isNull()
+                )
             except Exception as e:
-                print(f"[FreeCAD] Part.open failed: {e}")
+                log(f"[FreeCAD] Part.open failed: {e}")
 
     if not shapes:
         raise RuntimeError("No shapes found in document")
     
-    print(f"[FreeCAD] Loaded {len(shapes)} shape(s)")
+    log(f"[FreeCAD] Loaded {len(shapes)} shape(s)")
     
     return shapes, doc
 
@@ -127,18 +160,16 @@ def combine_shapes(shapes):
     if len(shapes) == 1:
         return shapes[0]
     
-    print(f"[FreeCAD] Combining {len(shapes)} shapes...")
-    
-    # Try to fuse shapes (creates a single solid if possible)
-    combined = shapes[0]
-    for shape in shapes[1:]:
-        try:
-            combined = combined.fuse(shape)
-        except Exception:
-            # If fusion fails, create a compound instead
-            combined = Part.makeCompound([combined, shape])
-    
-    return combined
+    log(f"[FreeCAD] Combining {len(shapes)} shapes...")
+
+    # Try to fuse shapes (creates a single solid if possible) in one
+    # batched OCCT boolean; a sequential fuse loop re-validates a growing
+    # operand and is quadratic in shape count
+    try:
+        return shapes[0].multiFuse(shapes[1:])
+    except Exception:
+        # If fusion fails, create a compound instead
+        return Part.makeCompound(shapes)
 
 
 def export_cad_file(shape, file_path):
@@ -151,7 +182,7 @@ def export_cad_file(shape, file_path):
     """
     ext = os.path.splitext(file_path)[1].lower()
     
-    print(f"[FreeCAD] Exporting to {ext.upper()}...")
+    log(f"[FreeCAD] Exporting to {ext.upper()}...")
     
     if ext in (".step", ".stp"):
         # STEP export with options for quality
@@ -192,19 +223,27 @@ def main():
     output_path = os.environ.get("OUTPUT_FILE_PATH")
     
     if not input_path or not output_path:
-        print("[FreeCAD] ERROR: INPUT_FILE_PATH and OUTPUT_FILE_PATH required")
+        log("[FreeCAD] ERROR: INPUT_FILE_PATH and OUTPUT_FILE_PATH required")
         sys.exit(1)
     
     input_ext = os.path.splitext(input_path)[1].lower()
     output_ext = os.path.splitext(output_path)[1].lower()
     
-    print(f"[FreeCAD] ════════════════════════════════════════════════════════")
-    print(f"[FreeCAD] CAD-to-CAD Conversion")
-    print(f"[FreeCAD] ════════════════════════════════════════════════════════")
-    print(f"[FreeCAD] Input:  {input_path} ({input_ext.upper()})")
-    print(f"[FreeCAD] Output: {output_path} ({output_ext.upper()})")
-    print(f"[FreeCAD] ════════════════════════════════════════════════════════")
-    
+    log(f"[FreeCAD] ════════════════════════════════════════════════════════")
+    log(f"[FreeCAD] CAD-to-CAD Conversion")
+    log(f"[FreeCAD] ════════════════════════════════════════════════════════")
+    log(f"[FreeCAD] Input:  {input_path} ({input_ext.upper()})")
+    log(f"[FreeCAD] Output: {output_path} ({output_ext.upper()})")
+    log(f"[FreeCAD] ════════════════════════════════════════════════════════")
+
+    # Same-format "conversion" (including .stp/.step and .igs/.iges
+    # aliases) is just a copy; skip the import/export pipeline entirely
+    if FORMAT_ALIASES.get(input_ext, input_ext) == FORMAT_ALIASES.get(output_ext, output_ext):
+        import shutil
+        shutil.copyfile(input_path, output_path)
+        log(f"[FreeCAD] Copy passthrough: {output_path} ({os.path.getsize(output_path)} bytes)")
+        return
+
     # Create new document
     doc = FreeCAD.newDocument("CADConversion")
     
@@ -216,11 +255,11 @@ def main():
         combined_shape = combine_shapes(shapes)
         
         # Log shape info
-        print(f"[FreeCAD] Shape type: {combined_shape.ShapeType}")
-        print(f"[FreeCAD] Solids: {len(combined_shape.Solids)}")
-        print(f"[FreeCAD] Shells: {len(combined_shape.Shells)}")
-        print(f"[FreeCAD] Faces:  {len(combined_shape.Faces)}")
-        print(f"[FreeCAD] Edges:  {len(combined_shape.Edges)}")
+        log(f"[FreeCAD] Shape type: {combined_shape.ShapeType}")
+        log(f"[FreeCAD] Solids: {len(combined_shape.Solids)}")
+        log(f"[FreeCAD] Shells: {len(combined_shape.Shells)}")
+        log(f"[FreeCAD] Faces:  {len(combined_shape.Faces)}")
+        log(f"[FreeCAD] Edges:  {len(combined_shape.Edges)}")
         
         # 3. Export to output format
         export_cad_file(combined_shape, output_path)
@@ -228,19 +267,21 @@ def main():
         # 4. Verify output
         if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
             output_size = os.path.getsize(output_path)
-            print(f"[FreeCAD] ════════════════════════════════════════════════════════")
-            print(f"[FreeCAD] SUCCESS")
-            print(f"[FreeCAD] Output: {output_path}")
-            print(f"[FreeCAD] Size:   {output_size} bytes ({output_size / 1024:.1f} KB)")
-            print(f"[FreeCAD] ════════════════════════════════════════════════════════")
+            log(f"[FreeCAD] ════════════════════════════════════════════════════════")
+            log(f"[FreeCAD] SUCCESS")
+            log(f"[FreeCAD] Output: {output_path}")
+            log(f"[FreeCAD] Size:   {output_size} bytes ({output_size / 1024:.1f} KB)")
+            log(f"[FreeCAD] ════════════════════════════════════════════════════════")
         else:
-            print("[FreeCAD] ERROR: Output file not created or empty")
+            log("[FreeCAD] ERROR: Output file not created or empty")
             sys.exit(1)
             
     except Exception as e:
-        print(f"[FreeCAD] ERROR: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log(f"[FreeCAD] ERROR: {str(e)}")
+        # Traceback formatting is only worth paying for when debugging
+        if os.environ.get("DEBUG"):
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
         
     finally:
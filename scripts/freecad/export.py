@@ -11,10 +11,22 @@ Usage:
 Environment Variables:
     INPUT_FILE_PATH: Path to input file
     OUTPUT_FILE_PATH: Path to output file
+    TESSELLATION_CACHE_DIR: Directory for cached tessellation results
+                            (default /tmp/freecad-tess-cache, empty to disable)
+    TESSELLATION_CACHE_ENTRIES: Cached tessellations to keep, oldest evicted
+                                first (default 32)
+    TESSELLATION_DEFLECTION: Linear deflection override (default adapts to
+                             the shape's bounding-box diagonal)
+    OPTIMIZE_VERTEX_CACHE: Set to 1/true/yes to reorder triangles for GPU
+                           vertex-cache locality (requires the meshoptimizer
+                           package)
 """
 
 import sys
 import os
+import hashlib
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 
 # Add FreeCAD library paths for Debian package
 freecad_paths = [
@@ -22,6 +34,7 @@ freecad_paths = [
     '/usr/share/freecad/Mod/Draft',  # For importDXF
     '/usr/share/freecad/Mod/Part',
     '/usr/share/freecad/Mod/Mesh',
+    '/usr/share/freecad/Mod/MeshPart',
     '/usr/share/freecad/Ext',
 ]
 for p in freecad_paths:
@@ -34,24 +47,528 @@ import Part
 import Mesh
 importDXF = None  # Lazy-loaded only when needed for DXF operations
 
+# MeshPart drives OCCT's BRepMesh_IncrementalMesh entirely from C++;
+# optional because some minimal FreeCAD builds ship without it
+try:
+    import MeshPart
+except ImportError:
+    MeshPart = None
+
+# numpy ships with FreeCAD's Python, but keep a fallback just in case
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: vertex-cache reordering for GPU-friendly output meshes
+try:
+    import meshoptimizer
+except ImportError:
+    meshoptimizer = None
+
+# Fallback tessellation accuracy (LinearDeflection, smaller = more polygons),
+# used when the shape has a degenerate bounding box
+DEFLECTION = 0.1
+
+# Number of cached tessellations to keep (oldest evicted first)
+TESS_CACHE_MAX_ENTRIES = int(os.environ.get("TESSELLATION_CACHE_ENTRIES", "32"))
+
+
+def log(message):
+    """
+    Write a progress line to stderr and flush immediately.
+
+    stderr keeps progress separate from any stdout protocol and, being
+    unbuffered, parallel workers sharing a pipe don't interleave partial
+    lines.
+    """
+    sys.stderr.write(message + "\n")
+    sys.stderr.flush()
+
+
+def resolve_deflection(shape):
+    """
+    Pick a linear deflection for tessellating the given shape.
+
+    A fixed deflection over-tessellates large models and under-tessellates
+    small ones, so scale it with the bounding-box diagonal (1/1000 of the
+    diagonal keeps visual quality while bounding triangle counts). The
+    TESSELLATION_DEFLECTION env var overrides with an absolute value.
+    """
+    override = os.environ.get("TESSELLATION_DEFLECTION")
+    if override:
+        return float(override)
+
+    diagonal = shape.BoundBox.DiagonalLength
+    if diagonal > 0:
+        return diagonal * 1e-3
+    return DEFLECTION
+
+
+def tessellation_cache_path(input_path, deflection_key):
+    """
+    Map an input file + deflection setting to a cache file path.
+
+    The key hashes the input file bytes, so any change to the input
+    invalidates the entry automatically. The adaptive deflection is a
+    pure function of the input, so keying on the override string (or
+    "adaptive") is sufficient. Returns None when caching is disabled
+    via an empty TESSELLATION_CACHE_DIR.
+    """
+    cache_dir = os.environ.get("TESSELLATION_CACHE_DIR", "/tmp/freecad-tess-cache")
+    if not cache_dir:
+        return None
+
+    digest = hashlib.sha256()
+    with open(input_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    digest.update(f":{deflection_key}".encode())
+
+    return os.path.join(cache_dir, digest.hexdigest() + ".tess")
+
+
+def evict_tessellation_cache(cache_dir):
+    """Keep the newest TESS_CACHE_MAX_ENTRIES cache files, drop the rest."""
+    try:
+        entries = [
+            os.path.join(cache_dir, name)
+            for name in os.listdir(cache_dir)
+            if name.endswith(".tess")
+        ]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for stale in entries[TESS_CACHE_MAX_ENTRIES:]:
+            os.remove(stale)
+            log(f"[FreeCAD] Evicted tessellation cache entry: {stale}")
+    except OSError as e:
+        log(f"[FreeCAD] Warning: Tessellation cache eviction failed: {e}")
+
+
+def load_tessellation_cache(cache_path):
+    """Return cached (vertices, faces) or None on miss/corruption."""
+    if not cache_path or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            vertices, faces = pickle.load(f)
+        os.utime(cache_path, None)  # refresh LRU timestamp
+        log(f"[FreeCAD] Tessellation cache hit ({len(faces)} faces)")
+        return vertices, faces
+    except Exception as e:
+        log(f"[FreeCAD] Warning: Could not read tessellation cache: {e}")
+        return None
+
+
+def store_tessellation_cache(cache_path, vertices, faces):
+    """Persist (vertices, faces) for reuse by later invocations."""
+    if not cache_path:
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to a temp file and rename so concurrent workers never
+        # see a half-written cache entry
+        tmp_path = cache_path + f".{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((vertices, faces), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        evict_tessellation_cache(os.path.dirname(cache_path))
+        log(f"[FreeCAD] Tessellation cached: {cache_path}")
+    except Exception as e:
+        log(f"[FreeCAD] Warning: Could not write tessellation cache: {e}")
+
+
+def configure_step_reader():
+    """
+    Tune FreeCAD's STEP reader for headless conversion.
+
+    ReadShapeCompoundMode makes Part.insert produce a single compound
+    document object instead of one object per sub-shape, skipping a lot
+    of per-object document overhead on large assemblies. Link groups are
+    a GUI/assembly feature this pipeline never uses.
+    """
+    try:
+        params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Import")
+        params.SetBool("ReadShapeCompoundMode", True)
+        params.SetBool("UseLinkGroup", False)
+    except Exception as e:
+        log(f"[FreeCAD] Warning: Could not configure STEP reader: {e}")
+
+
+def try_occ_direct_convert(input_path, output_path):
+    """
+    Convert STEP/IGES straight to STL via pythonocc-core.
+
+    Drives OpenCASCADE directly — reader, incremental mesher and STL
+    writer — without creating FreeCAD document objects at all, which is
+    both faster and much lighter on RAM. Returns True on success; False
+    when pythonocc-core is not installed, the conversion pair is not
+    supported, or anything fails (the caller falls back to the FreeCAD
+    pipeline).
+    """
+    input_ext = os.path.splitext(input_path)[1].lower()
+    output_ext = os.path.splitext(output_path)[1].lower()
+    if output_ext != ".stl" or input_ext not in (".step", ".stp", ".iges", ".igs"):
+        return False
+
+    try:
+        from OCC.Core.STEPControl import STEPControl_Reader
+        from OCC.Core.IGESControl import IGESControl_Reader
+        from OCC.Core.IFSelect import IFSelect_RetDone
+        from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+        from OCC.Core.StlAPI import StlAPI_Writer
+        from OCC.Core.Bnd import Bnd_Box
+        from OCC.Core.BRepBndLib import brepbndlib
+    except ImportError:
+        return False
+
+    try:
+        if input_ext in (".step", ".stp"):
+            reader = STEPControl_Reader()
+        else:
+            reader = IGESControl_Reader()
+        if reader.ReadFile(input_path) != IFSelect_RetDone:
+            log("[FreeCAD] Warning: OCCT reader failed, falling back to FreeCAD import")
+            return False
+        reader.TransferRoots()
+        shape = reader.OneShape()
+
+        # Same deflection policy as the FreeCAD path, computed from an
+        # OCCT bounding box since there is no FreeCAD shape here
+        override = os.environ.get("TESSELLATION_DEFLECTION")
+        if override:
+            deflection = float(override)
+        else:
+            box = Bnd_Box()
+            brepbndlib.Add(shape, box)
+            xmin, ymin, zmin, xmax, ymax, zmax = box.Get()
+            diagonal = (
+                (xmax - xmin) ** 2 + (ymax - ymin) ** 2 + (zmax - zmin) ** 2
+            ) ** 0.5
+            deflection = diagonal * 1e-3 if diagonal > 0 else DEFLECTION
+
+        log(f"[FreeCAD] Direct OCCT path (deflection={deflection:.4g})")
+        # Distribute per-face meshing across threads. IMeshTools_Parameters
+        # is the explicit spelling on OCCT 7.4+; older pythonocc builds
+        # only take the positional form, where the final bool is InParallel
+        try:
+            from OCC.Core.IMeshTools import IMeshTools_Parameters
+            mesh_params = IMeshTools_Parameters()
+            mesh_params.Deflection = deflection
+            mesh_params.Angle = 0.5
+            mesh_params.Relative = False
+            mesh_params.InParallel = True
+            BRepMesh_IncrementalMesh(shape, mesh_params)
+        except ImportError:
+            BRepMesh_IncrementalMesh(shape, deflection, False, 0.5, True)
+
+        writer = StlAPI_Writer()
+        writer.SetASCIIMode(False)
+        if not writer.Write(shape, output_path):
+            log("[FreeCAD] Warning: OCCT STL writer failed, falling back")
+            return False
+
+        return os.path.exists(output_path) and os.path.getsize(output_path) > 0
+    except Exception as e:
+        log(f"[FreeCAD] Warning: Direct OCCT conversion failed: {e}")
+        return False
+
+
+def tessellate_shapes(shapes, deflection):
+    """
+    Tessellate each shape independently and merge the results.
+
+    Shape.tessellate runs inside OCCT with the GIL released, so a thread
+    pool parallelizes multi-shape assemblies across cores. Face indices
+    of each shape are offset by the running vertex count so the merged
+    (vertices, faces) pair describes one combined mesh. Vertices are
+    normalized to plain tuples so they survive pickling (tessellate
+    returns FreeCAD Vector objects).
+    """
+    if len(shapes) == 1:
+        results = [shapes[0].tessellate(deflection)]
+    else:
+        max_workers = min(len(shapes), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(lambda s: s.tessellate(deflection), shapes))
+
+    vertices = []
+    faces = []
+    for shape_vertices, shape_faces in results:
+        offset = len(vertices)
+        vertices.extend((v.x, v.y, v.z) for v in shape_vertices)
+        if offset:
+            faces.extend(tuple(i + offset for i in face) for face in shape_faces)
+        else:
+            faces.extend(shape_faces)
+    return vertices, faces
+
+
+def weld_vertices(vertices, faces, deflection):
+    """
+    Merge duplicate vertices along shared edges.
+
+    Per-shape (and per-face) tessellation emits its own copy of every
+    boundary vertex, typically inflating vertex count 2-4x. Coordinates
+    are quantized to 1/100 of the deflection, identical cells collapsed
+    with numpy.unique, and face indices remapped onto the unique set.
+    Triangles that degenerate under welding are dropped.
+    """
+    if np is None or not vertices:
+        return vertices, faces
+
+    V = np.asarray(vertices, dtype=np.float64)
+    F = np.asarray([f[:3] for f in faces if len(f) >= 3], dtype=np.intp)
+    if len(F) == 0:
+        return vertices, faces
+
+    tolerance = deflection * 1e-2
+    quantized = np.round(V / tolerance).astype(np.int64)
+    _, index, inverse = np.unique(
+        quantized, axis=0, return_index=True, return_inverse=True
+    )
+    if len(index) == len(V):
+        return vertices, faces
+
+    V2 = V[index]
+    F2 = inverse.reshape(-1)[F]
+
+    degenerate = (
+        (F2[:, 0] == F2[:, 1]) | (F2[:, 1] == F2[:, 2]) | (F2[:, 0] == F2[:, 2])
+    )
+    F2 = F2[~degenerate]
+
+    log(f"[FreeCAD] Welded vertices: {len(V)} → {len(V2)}")
+    return [tuple(v) for v in V2.tolist()], F2.tolist()
+
+
+def optimize_vertex_order(vertices, faces):
+    """
+    Reorder triangles and vertices for GPU vertex-cache locality.
+
+    Tessellation emits triangles in arbitrary order, which wastes the
+    post-transform vertex cache of whatever renders the exported mesh.
+    meshoptimizer's Tipsify-style reordering fixes that at negligible
+    cost. Opt-in via OPTIMIZE_VERTEX_CACHE=1 (or true/yes, matching the
+    server's env parsing); silently skipped when the meshoptimizer package
+    or numpy is unavailable.
+    """
+    if os.environ.get("OPTIMIZE_VERTEX_CACHE", "").lower() not in ("1", "true", "yes"):
+        return vertices, faces
+    if meshoptimizer is None or np is None:
+        log("[FreeCAD] Warning: OPTIMIZE_VERTEX_CACHE set but meshoptimizer/numpy unavailable")
+        return vertices, faces
+
+    try:
+        V = np.ascontiguousarray(np.asarray(vertices, dtype=np.float32))
+        indices = np.ascontiguousarray(
+            np.asarray([f[:3] for f in faces if len(f) >= 3], dtype=np.uint32)
+        ).reshape(-1)
+
+        # Reorder triangles for cache reuse, then vertices for fetch
+        # locality. Both calls write into destination buffers; the fetch
+        # pass also remaps the index buffer in place and returns how many
+        # unique vertices the reordered buffer actually holds
+        optimized_indices = np.empty_like(indices)
+        meshoptimizer.optimize_vertex_cache(optimized_indices, indices, len(indices), len(V))
+        indices = optimized_indices
+
+        fetched = np.empty_like(V)
+        unique_count = meshoptimizer.optimize_vertex_fetch(fetched, indices, V)
+        V = fetched[:unique_count]
+
+        log("[FreeCAD] Applied vertex-cache optimization")
+        return [tuple(v) for v in V.tolist()], indices.reshape(-1, 3).tolist()
+    except Exception as e:
+        log(f"[FreeCAD] Warning: Vertex-cache optimization failed: {e}")
+        return vertices, faces
+
+
+def build_mesh(vertices, faces):
+    """
+    Build a Mesh from tessellation output.
+
+    Gathers all triangle vertices into one contiguous numpy buffer with a
+    single fancy-index (V[F]) and hands the flat point list to the C++
+    Mesh constructor in one call, instead of one Python-level call per
+    triangle. Falls back to a plain loop when numpy is unavailable.
+    """
+    if np is not None:
+        V = np.asarray(vertices, dtype=np.float64)
+        F = np.asarray([f[:3] for f in faces if len(f) >= 3], dtype=np.intp)
+        if len(F) == 0:
+            return Mesh.Mesh()
+        triangles = V[F].reshape(-1, 3).tolist()
+        return Mesh.Mesh(triangles)
+
+    triangles = []
+    for face in faces:
+        if len(face) >= 3:
+            triangles.append(vertices[face[0]])
+            triangles.append(vertices[face[1]])
+            triangles.append(vertices[face[2]])
+    return Mesh.Mesh(triangles)
+
+
+def write_stl_binary(vertices, faces, output_path):
+    """
+    Write a binary STL (80-byte header, uint32 count, 50-byte records)
+    straight from the numpy buffers with one tofile call.
+    """
+    V = np.asarray(vertices, dtype=np.float32)
+    F = np.asarray([f[:3] for f in faces if len(f) >= 3], dtype=np.intp)
+    triangles = V[F]  # (n, 3, 3)
+
+    edge1 = triangles[:, 1] - triangles[:, 0]
+    edge2 = triangles[:, 2] - triangles[:, 0]
+    normals = np.cross(edge1, edge2)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    records = np.zeros(len(triangles), dtype=np.dtype([
+        ("normal", "<f4", 3),
+        ("vertices", "<f4", (3, 3)),
+        ("attr", "<u2"),
+    ]))
+    records["normal"] = normals
+    records["vertices"] = triangles
+
+    with open(output_path, "wb") as f:
+        # Binary STL headers must not start with "solid"
+        f.write(b"Binary STL (FreeCAD export script)".ljust(80)[:80])
+        f.write(np.uint32(len(triangles)).tobytes())
+        records.tofile(f)
+
+
+def write_ply_binary(vertices, faces, output_path):
+    """Write a binary little-endian PLY straight from the numpy buffers."""
+    V = np.asarray(vertices, dtype="<f4")
+    F = np.asarray([f[:3] for f in faces if len(f) >= 3], dtype="<i4")
+
+    header = (
+        "ply\n"
+        "format binary_little_endian 1.0\n"
+        f"element vertex {len(V)}\n"
+        "property float x\n"
+        "property float y\n"
+        "property float z\n"
+        f"element face {len(F)}\n"
+        "property list uchar int vertex_indices\n"
+        "end_header\n"
+    )
+    face_records = np.zeros(len(F), dtype=np.dtype([
+        ("count", "<u1"),
+        ("indices", "<i4", 3),
+    ]))
+    face_records["count"] = 3
+    face_records["indices"] = F
+
+    with open(output_path, "wb") as f:
+        f.write(header.encode("ascii"))
+        V.tofile(f)
+        face_records.tofile(f)
+
+
+def export_arrays(vertices, faces, output_path):
+    """
+    Export STL/PLY output directly from the (vertices, faces) buffers,
+    bypassing FreeCAD Mesh construction and its Python-mediated writer.
+
+    Returns True when the format was handled; the caller falls back to
+    the Mesh path for other formats or on failure.
+    """
+    if np is None or not vertices or not faces:
+        return False
+
+    output_ext = os.path.splitext(output_path)[1].lower()
+    try:
+        if output_ext == ".stl":
+            write_stl_binary(vertices, faces, output_path)
+        elif output_ext == ".ply":
+            write_ply_binary(vertices, faces, output_path)
+        else:
+            return False
+    except Exception as e:
+        log(f"[FreeCAD] Warning: Direct {output_ext} writer failed: {e}")
+        return False
+
+    log(f"[FreeCAD] Mesh has {len(vertices)} vertices, {len(faces)} faces")
+    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+        log(f"[FreeCAD] SUCCESS: Output written to {output_path}")
+        log(f"[FreeCAD] Output size: {os.path.getsize(output_path)} bytes")
+        return True
+    return False
+
+
+def export_mesh(mesh, output_path):
+    """Write the mesh to the output path and verify the result."""
+    output_ext = os.path.splitext(output_path)[1].lower()
+
+    log(f"[FreeCAD] Mesh has {mesh.CountPoints} vertices, {mesh.CountFacets} faces")
+
+    if mesh.CountFacets == 0:
+        log("[FreeCAD] ERROR: No mesh faces generated")
+        sys.exit(1)
+
+    # Export mesh (Mesh.write infers format from the extension;
+    # STL, OBJ and PLY are all supported)
+    if output_ext in (".stl", ".obj", ".ply"):
+        mesh.write(output_path)
+    else:
+        # Default to STL
+        mesh.write(output_path)
+
+    # Verify output
+    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+        log(f"[FreeCAD] SUCCESS: Output written to {output_path}")
+        log(f"[FreeCAD] Output size: {os.path.getsize(output_path)} bytes")
+    else:
+        log("[FreeCAD] ERROR: Output file not created or empty")
+        sys.exit(1)
+
+
 def main():
     input_path = os.environ.get("INPUT_FILE_PATH")
     output_path = os.environ.get("OUTPUT_FILE_PATH")
-    
+
     if not input_path or not output_path:
-        print("[FreeCAD] ERROR: INPUT_FILE_PATH and OUTPUT_FILE_PATH required")
+        log("[FreeCAD] ERROR: INPUT_FILE_PATH and OUTPUT_FILE_PATH required")
         sys.exit(1)
-    
+
     input_ext = os.path.splitext(input_path)[1].lower()
     output_ext = os.path.splitext(output_path)[1].lower()
-    
-    print(f"[FreeCAD] Converting: {input_ext} → {output_ext}")
-    print(f"[FreeCAD] Input: {input_path}")
-    print(f"[FreeCAD] Output: {output_path}")
-    
+
+    log(f"[FreeCAD] Converting: {input_ext} → {output_ext}")
+    log(f"[FreeCAD] Input: {input_path}")
+    log(f"[FreeCAD] Output: {output_path}")
+
+    # Tessellation results are cached on disk keyed by input file
+    # contents, so a repeat conversion of the same input skips both the
+    # CAD import and the tessellation entirely
+    cache_path = None
+    try:
+        deflection_key = os.environ.get("TESSELLATION_DEFLECTION", "adaptive")
+        cache_path = tessellation_cache_path(input_path, deflection_key)
+    except OSError as e:
+        log(f"[FreeCAD] Warning: Could not hash input for cache: {e}")
+
+    cached = load_tessellation_cache(cache_path)
+    if cached is not None:
+        vertices, faces = cached
+        vertices, faces = optimize_vertex_order(vertices, faces)
+        if not export_arrays(vertices, faces, output_path):
+            export_mesh(build_mesh(vertices, faces), output_path)
+        return
+
+    # Direct OCCT path: STEP/IGES → STL without FreeCAD document objects
+    # (used when the optional pythonocc-core package is installed)
+    if try_occ_direct_convert(input_path, output_path):
+        log(f"[FreeCAD] SUCCESS: Output written to {output_path}")
+        log(f"[FreeCAD] Output size: {os.path.getsize(output_path)} bytes")
+        return
+
     # Create new document
     doc = FreeCAD.newDocument("Conversion")
-    
+
     try:
         # Import based on file type
         if input_ext == ".dxf":
@@ -60,101 +577,90 @@ def main():
                 import importDXF
             importDXF.open(input_path)
         elif input_ext in (".step", ".stp"):
+            configure_step_reader()
             Part.insert(input_path, doc.Name)
         elif input_ext in (".iges", ".igs"):
             Part.insert(input_path, doc.Name)
         elif input_ext == ".brep":
             Part.insert(input_path, doc.Name)
         else:
-            print(f"[FreeCAD] ERROR: Unsupported input format: {input_ext}")
+            log(f"[FreeCAD] ERROR: Unsupported input format: {input_ext}")
             sys.exit(1)
-        
+
         # Get all documents (importDXF.open may create a new one)
         doc = FreeCAD.ActiveDocument
         if doc is None:
-            print("[FreeCAD] ERROR: No document created")
+            log("[FreeCAD] ERROR: No document created")
             sys.exit(1)
-        
-        # Collect all shapes
-        shapes = []
-        for obj in doc.Objects:
-            if hasattr(obj, "Shape") and obj.Shape:
-                shapes.append(obj.Shape)
-        
+
+        # Collect all shapes via the C++-side typed filter; documents
+        # imported from DXF can contain thousands of objects, and the
+        # per-object hasattr scan was pure Python overhead
+        shapes = [
+            obj.Shape for obj in doc.findObjects(Type="Part::Feature")
+            if not obj.Shape.isNull()
+        ]
+
         if not shapes:
-            print("[FreeCAD] ERROR: No shapes found in document")
-            sys.exit(1)
-        
-        print(f"[FreeCAD] Found {len(shapes)} shapes")
-        
-        # Combine all shapes
-        if len(shapes) == 1:
-            combined = shapes[0]
-        else:
-            combined = shapes[0]
-            for shape in shapes[1:]:
-                try:
-                    combined = combined.fuse(shape)
-                except:
-                    # If fusion fails, just add to compound
-                    combined = Part.makeCompound([combined, shape])
-        
-        # Tesselate to mesh
-        print("[FreeCAD] Tessellating to mesh...")
-        mesh = Mesh.Mesh()
-        
-        # Use tessellation with reasonable precision
-        # LinearDeflection controls the accuracy (smaller = more polygons)
-        tessellation = combined.tessellate(0.1)
-        
-        if tessellation and len(tessellation[0]) > 0:
-            vertices = tessellation[0]
-            faces = tessellation[1]
-            
-            # Build mesh from tessellation
-            for face in faces:
-                if len(face) >= 3:
-                    v1 = vertices[face[0]]
-                    v2 = vertices[face[1]]
-                    v3 = vertices[face[2]]
-                    mesh.addFacet(v1[0], v1[1], v1[2],
-                                  v2[0], v2[1], v2[2],
-                                  v3[0], v3[1], v3[2])
-        else:
-            print("[FreeCAD] Warning: Direct tessellation failed, trying mesh export...")
-            # Fallback: try to get mesh from shape directly
-            mesh = FreeCAD.ActiveDocument.addObject("Mesh::Feature", "Mesh")
-            mesh.Mesh = Mesh.Mesh(combined.tessellate(0.1))
-        
-        print(f"[FreeCAD] Mesh has {mesh.CountPoints} vertices, {mesh.CountFacets} faces")
-        
-        if mesh.CountFacets == 0:
-            print("[FreeCAD] ERROR: No mesh faces generated")
+            log("[FreeCAD] ERROR: No shapes found in document")
             sys.exit(1)
-        
-        # Export mesh
-        if output_ext == ".stl":
-            mesh.write(output_path)
-        elif output_ext == ".obj":
-            mesh.write(output_path)
-        elif output_ext == ".ply":
-            mesh.write(output_path)
-        else:
-            # Default to STL
-            mesh.write(output_path)
-        
-        # Verify output
-        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-            print(f"[FreeCAD] SUCCESS: Output written to {output_path}")
-            print(f"[FreeCAD] Output size: {os.path.getsize(output_path)} bytes")
+
+        log(f"[FreeCAD] Found {len(shapes)} shapes")
+
+        # Drop face-less construction geometry (e.g. Draft lines) that
+        # tessellates to nothing — but only when real faces exist, so
+        # edge-only documents still reach the fallback path unchanged
+        with_faces = [shape for shape in shapes if shape.Faces]
+        if with_faces and len(with_faces) < len(shapes):
+            log(f"[FreeCAD] Skipping {len(shapes) - len(with_faces)} face-less construction shapes")
+            shapes = with_faces
+
+        # Combine all shapes into a compound. Mesh output never needs
+        # boolean union semantics — tessellation handles compounds
+        # natively, and overlapping vs. unioned geometry produces the
+        # same triangles — so the expensive OCCT fuse is skipped entirely
+        combined = shapes[0] if len(shapes) == 1 else Part.makeCompound(shapes)
+
+        # Tesselate to mesh. Each shape is tessellated independently (in
+        # parallel for multi-shape assemblies) — the fused shape is only
+        # needed for deflection resolution and the fallback path, since
+        # mesh output does not require boolean union semantics
+        deflection = resolve_deflection(combined)
+        log(f"[FreeCAD] Tessellating to mesh (deflection={deflection:.4g})...")
+        vertices, faces = tessellate_shapes(shapes, deflection)
+
+        if vertices:
+            vertices, faces = weld_vertices(vertices, faces, deflection)
+            # Cache the canonical tessellation; optimization is applied
+            # after load so toggling the flag doesn't invalidate entries
+            store_tessellation_cache(cache_path, vertices, faces)
+            vertices, faces = optimize_vertex_order(vertices, faces)
+            if export_arrays(vertices, faces, output_path):
+                return
+            mesh = build_mesh(vertices, faces)
+        elif MeshPart is not None:
+            log("[FreeCAD] Warning: Direct tessellation failed, trying MeshPart...")
+            # Fallback: mesh the shape via OCCT's incremental mesher, which
+            # builds the Mesh with no Python-side facet iteration
+            mesh = MeshPart.meshFromShape(
+                Shape=combined,
+                LinearDeflection=deflection,
+                AngularDeflection=0.5,
+                Relative=False,
+            )
         else:
-            print("[FreeCAD] ERROR: Output file not created or empty")
-            sys.exit(1)
-            
+            log("[FreeCAD] Warning: Direct tessellation failed, trying mesh export...")
+            # Last resort: try to get mesh from shape directly
+            mesh = Mesh.Mesh(combined.tessellate(deflection))
+
+        export_mesh(mesh, output_path)
+
     except Exception as e:
-        print(f"[FreeCAD] ERROR: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log(f"[FreeCAD] ERROR: {str(e)}")
+        # Traceback formatting is only worth paying for when debugging
+        if os.environ.get("DEBUG"):
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
     finally:
         FreeCAD.closeDocument(doc.Name)
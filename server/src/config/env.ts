@@ -12,6 +12,8 @@ export interface Config {
   conversionTimeout: number; // in ms
   maxConcurrentBlender: number;
   maxConcurrentAssimp: number;
+  blenderPersistentWorker: boolean;
+  batchConcurrency: number;
   cleanupIntervalMs: number;
   fileAgeLimitMs: number;
 }
@@ -24,6 +26,12 @@ function getEnvVar(key: string, defaultValue?: string): string {
   return value;
 }
 
+function getEnvBool(key: string, defaultValue: boolean): boolean {
+  const value = process.env[key];
+  if (value === undefined) return defaultValue;
+  return ['1', 'true', 'yes'].includes(value.toLowerCase());
+}
+
 function getEnvNumber(key: string, defaultValue: number): number {
   const value = process.env[key];
   if (value === undefined) return defaultValue;
@@ -44,6 +52,8 @@ export const config: Config = {
   conversionTimeout: getEnvNumber('CONVERSION_TIMEOUT', 5 * 60 * 1000), // 5 minutes
   maxConcurrentBlender: getEnvNumber('MAX_CONCURRENT_BLENDER', 2),
   maxConcurrentAssimp: getEnvNumber('MAX_CONCURRENT_ASSIMP', 5),
+  blenderPersistentWorker: getEnvBool('BLENDER_PERSISTENT_WORKER', false),
+  batchConcurrency: getEnvNumber('BATCH_CONCURRENCY', 4),
   cleanupIntervalMs: getEnvNumber('CLEANUP_INTERVAL_MS', 60 * 1000), // 1 minute
   fileAgeLimitMs: getEnvNumber('FILE_AGE_LIMIT_MS', 2 * 60 * 1000), // 2 minutes
 };
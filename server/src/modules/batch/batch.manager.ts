@@ -7,6 +7,12 @@ import { BatchJob, BatchFile, FileStatus, BatchStatusResult } from './batch.type
 import { convertFile } from '../conversion/conversion.service';
 import path from 'path';
 import fs from 'fs-extra';
+import pLimit from 'p-limit';
+import config from '../../config/env';
+
+// Convert batch files concurrently; the per-tool p-limits in the providers
+// still cap how many Blender/FreeCAD processes actually run at once
+const batchLimit = pLimit(config.batchConcurrency);
 
 // In-memory storage for batch jobs (could be Redis in production)
 const jobs = new Map<string, BatchJob>();
@@ -83,7 +89,9 @@ export function getBatchJob(jobId: string): BatchJob | null {
 }
 
 /**
- * Process batch job - converts files sequentially
+ * Process batch job - converts files concurrently (up to BATCH_CONCURRENCY
+ * at a time) so multi-file batches use the available cores instead of
+ * running strictly one after another
  */
 export async function processBatchJob(jobId: string): Promise<void> {
   const job = jobs.get(jobId);
@@ -98,57 +106,66 @@ export async function processBatchJob(jobId: string): Promise<void> {
   }
 
   job.isProcessing = true;
-  console.log(`[Batch] Starting batch processing for job ${jobId} (${job.totalCount} files)`);
-
-  for (const file of job.files) {
-    if (file.status !== 'pending') continue;
-
-    // Update status to converting
-    file.status = 'converting';
-    console.log(`[Batch] Converting file: ${file.originalName} (${file.inputFormat} → ${file.outputFormat})`);
-
-    try {
-      const result = await convertFile(file.inputPath, file.outputFormat);
-      
-      // Generate download filename
-      const originalBaseName = path.basename(file.originalName, path.extname(file.originalName));
-      const safeOriginalName = originalBaseName.replace(/[^a-zA-Z0-9._-]/g, '_');
-      const timestamp = Date.now();
-      const downloadFilename = `${timestamp}_${safeOriginalName}.${file.outputFormat}`;
-      
-      // Rename output file
-      const outputDir = path.dirname(result.outputPath);
-      const finalOutputPath = path.join(outputDir, downloadFilename);
-      await fs.move(result.outputPath, finalOutputPath, { overwrite: true });
-
-      // Update file status
-      file.status = 'completed';
-      file.downloadUrl = `/api/download/${downloadFilename}`;
-      file.outputPath = finalOutputPath;
-      file.tool = result.tool;
-      file.duration = result.duration;
-      job.completedCount++;
-
-      // Cleanup input file
-      await fs.remove(file.inputPath).catch(() => {});
-
-      console.log(`[Batch] ✓ Completed: ${file.originalName} (${result.tool}, ${result.duration}ms)`);
-    } catch (error) {
-      file.status = 'error';
-      file.error = error instanceof Error ? error.message : 'Unknown error';
-      job.completedCount++;
-
-      // Cleanup input file on error
-      await fs.remove(file.inputPath).catch(() => {});
+  console.log(`[Batch] Starting batch processing for job ${jobId} (${job.totalCount} files, concurrency ${config.batchConcurrency})`);
 
-      console.error(`[Batch] ✗ Failed: ${file.originalName} - ${file.error}`);
-    }
-  }
+  await Promise.all(
+    job.files
+      .filter(file => file.status === 'pending')
+      .map(file => batchLimit(() => processBatchFile(job, file)))
+  );
 
   job.isProcessing = false;
   console.log(`[Batch] Batch processing complete for job ${jobId}`);
 }
 
+/**
+ * Convert a single file of a batch job and update its status
+ */
+async function processBatchFile(job: BatchJob, file: BatchFile): Promise<void> {
+  // Update status to converting
+  file.status = 'converting';
+  console.log(`[Batch] Converting file: ${file.originalName} (${file.inputFormat} → ${file.outputFormat})`);
+
+  try {
+    const result = await convertFile(file.inputPath, file.outputFormat);
+
+    // Generate download filename. The file id keeps names unique even when
+    // files with the same original name finish in the same millisecond,
+    // which concurrent processing makes possible
+    const originalBaseName = path.basename(file.originalName, path.extname(file.originalName));
+    const safeOriginalName = originalBaseName.replace(/[^a-zA-Z0-9._-]/g, '_');
+    const timestamp = Date.now();
+    const downloadFilename = `${timestamp}_${file.id.slice(0, 8)}_${safeOriginalName}.${file.outputFormat}`;
+
+    // Rename output file
+    const outputDir = path.dirname(result.outputPath);
+    const finalOutputPath = path.join(outputDir, downloadFilename);
+    await fs.move(result.outputPath, finalOutputPath, { overwrite: true });
+
+    // Update file status
+    file.status = 'completed';
+    file.downloadUrl = `/api/download/${downloadFilename}`;
+    file.outputPath = finalOutputPath;
+    file.tool = result.tool;
+    file.duration = result.duration;
+    job.completedCount++;
+
+    // Cleanup input file
+    await fs.remove(file.inputPath).catch(() => {});
+
+    console.log(`[Batch] ✓ Completed: ${file.originalName} (${result.tool}, ${result.duration}ms)`);
+  } catch (error) {
+    file.status = 'error';
+    file.error = error instanceof Error ? error.message : 'Unknown error';
+    job.completedCount++;
+
+    // Cleanup input file on error
+    await fs.remove(file.inputPath).catch(() => {});
+
+    console.error(`[Batch] ✗ Failed: ${file.originalName} - ${file.error}`);
+  }
+}
+
 /**
  * Cleanup a batch job and its files
  */
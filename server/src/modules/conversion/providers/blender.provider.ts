@@ -35,9 +35,210 @@ export async function blenderConvert(
   const { timeout = config.conversionTimeout, decimateTargetFaces } = options;
 
   // Use p-limit to queue heavy conversions
+  if (config.blenderPersistentWorker) {
+    return blenderLimit(() => executeViaWorker(inputPath, outputPath, timeout, decimateTargetFaces));
+  }
   return blenderLimit(() => executeBlender(inputPath, outputPath, timeout, decimateTargetFaces));
 }
 
+// ─── Persistent worker ──────────────────────────────────────────────────
+// A single long-lived Blender process in worker mode (BLENDER_WORKER_MODE=1)
+// reads one JSON job per stdin line and answers with one "[BlenderWorker]"
+// JSON line on stdout. This amortizes the 1-3s Blender startup + addon
+// registration cost across conversions. Enabled via BLENDER_PERSISTENT_WORKER.
+
+const WORKER_RESULT_PREFIX = '[BlenderWorker] ';
+
+/**
+ * Addons to pre-enable via Blender's --addons CLI flag, so the Python
+ * script's addon-registration loop becomes a no-op and userprefs are
+ * never rewritten per invocation
+ */
+function addonsFor(inputFormat: string, outputFormat: string): string[] {
+  const addons = ['io_scene_gltf2'];
+  if (inputFormat === 'dxf') addons.push('io_import_dxf');
+  if (outputFormat === 'dxf') addons.push('io_export_dxf');
+  return addons;
+}
+
+interface WorkerResult {
+  ready?: boolean;
+  ok?: boolean;
+  error?: string;
+}
+
+let workerProc: ChildProcess | null = null;
+let workerStdoutBuffer = '';
+let workerResultHandler: ((result: WorkerResult) => void) | null = null;
+// Serializes jobs: the worker handles exactly one conversion at a time
+let workerChain: Promise<unknown> = Promise.resolve();
+
+function killWorker(): void {
+  if (workerProc) {
+    workerProc.kill('SIGKILL');
+    workerProc = null;
+  }
+  workerStdoutBuffer = '';
+  workerResultHandler = null;
+}
+
+/**
+ * Spawn the persistent worker and wait for its ready handshake
+ */
+function spawnWorker(): Promise<ChildProcess> {
+  return new Promise((resolve, reject) => {
+    const proc = spawn('blender', [
+      '--background',
+      '-noaudio',
+      // The worker handles all formats, so pre-enable every addon it may need
+      '--addons', 'io_scene_gltf2,io_import_dxf,io_export_dxf',
+      '--python', BLENDER_SCRIPT_PATH
+    ], {
+      env: { ...process.env, BLENDER_WORKER_MODE: '1' },
+      stdio: ['pipe', 'pipe', 'pipe']
+    });
+
+    let ready = false;
+
+    proc.stdout?.on('data', (data) => {
+      workerStdoutBuffer += data.toString();
+      let newlineIndex;
+      while ((newlineIndex = workerStdoutBuffer.indexOf('\n')) !== -1) {
+        const line = workerStdoutBuffer.slice(0, newlineIndex).trim();
+        workerStdoutBuffer = workerStdoutBuffer.slice(newlineIndex + 1);
+
+        if (line.includes('[Blender]')) {
+          console.log(line);
+        }
+
+        const prefixIndex = line.indexOf(WORKER_RESULT_PREFIX);
+        if (prefixIndex === -1) continue;
+
+        let result: WorkerResult;
+        try {
+          result = JSON.parse(line.slice(prefixIndex + WORKER_RESULT_PREFIX.length));
+        } catch {
+          continue;
+        }
+
+        if (result.ready && !ready) {
+          ready = true;
+          resolve(proc);
+        } else if (workerResultHandler) {
+          workerResultHandler(result);
+        }
+      }
+    });
+
+    proc.stderr?.on('data', () => { /* Blender is chatty on stderr; ignored */ });
+
+    proc.on('error', (err) => {
+      killWorker();
+      if (!ready) reject(new ConversionError(`Blender worker failed to start: ${err.message}`));
+    });
+
+    proc.on('close', (code) => {
+      if (workerProc === proc) {
+        workerProc = null;
+        workerStdoutBuffer = '';
+      }
+      const handler = workerResultHandler;
+      workerResultHandler = null;
+      if (handler) {
+        handler({ ok: false, error: `Blender worker exited with code ${code}` });
+      }
+      if (!ready) {
+        reject(new ConversionError(`Blender worker exited with code ${code} before becoming ready`));
+      }
+    });
+
+    workerProc = proc;
+  });
+}
+
+/**
+ * Run one conversion through the persistent worker.
+ * The worker is (re)spawned on demand and killed on timeout so a hung
+ * job cannot poison subsequent conversions.
+ */
+async function executeViaWorker(
+  inputPath: string,
+  outputPath: string,
+  timeout: number,
+  decimateTargetFaces?: number
+): Promise<string> {
+  const run = workerChain.then(async () => {
+    const inputFormat = path.extname(inputPath).slice(1).toLowerCase();
+    const outputFormat = path.extname(outputPath).slice(1).toLowerCase();
+
+    console.log(`[Blender] Converting ${inputFormat} → ${outputFormat} (persistent worker)`);
+
+    if (!workerProc) {
+      await spawnWorker();
+    }
+    const proc = workerProc!;
+
+    const result = await new Promise<WorkerResult>((resolve, reject) => {
+      const timeoutId = setTimeout(() => {
+        workerResultHandler = null;
+        killWorker();
+        reject(new TimeoutError(`Blender conversion timed out after ${timeout}ms`));
+      }, timeout);
+
+      workerResultHandler = (res) => {
+        clearTimeout(timeoutId);
+        workerResultHandler = null;
+        resolve(res);
+      };
+
+      proc.stdin?.write(JSON.stringify({
+        input_file_path: inputPath,
+        input_file_format: inputFormat,
+        output_file_path: outputPath,
+        output_file_format: outputFormat,
+        ...(decimateTargetFaces ? { decimate_target_faces: decimateTargetFaces } : {}),
+      }) + '\n');
+    });
+
+    if (!result.ok) {
+      throw new ConversionError(
+        'Blender conversion failed',
+        result.error || 'Unknown worker error'
+      );
+    }
+
+    const isValid = await checkOutputValidity(outputPath, outputFormat);
+    if (!isValid) {
+      throw new ConversionError(
+        'Blender conversion produced empty output (no geometry found)',
+        'The input file may contain unsupported geometry types like ACIS 3D solids'
+      );
+    }
+
+    console.log(`[Blender] Conversion successful`);
+    return outputPath;
+  });
+
+  // Keep the chain alive even when a job fails
+  workerChain = run.catch(() => undefined);
+  return run;
+}
+
+/**
+ * Read at most maxBytes from the start of a file, so validity probes
+ * never pull a multi-hundred-MB export into memory
+ */
+async function readHead(filePath: string, maxBytes: number): Promise<Buffer> {
+  const fd = await fs.open(filePath, 'r');
+  try {
+    const buffer = Buffer.alloc(maxBytes);
+    const { bytesRead } = await fs.read(fd, buffer, 0, maxBytes, 0);
+    return buffer.subarray(0, bytesRead);
+  } finally {
+    await fs.close(fd);
+  }
+}
+
 /**
  * Check if output file has valid geometry (not empty)
  * Different formats have different "empty" signatures
@@ -64,22 +265,23 @@ async function checkOutputValidity(outputPath: string, format: string): Promise<
       return false;
     }
     
-    // For OBJ files, also check if there are any vertices
+    // For OBJ files, also check if there are any vertices. The header is
+    // tiny, so vertex lines show up well within the first 64KB
     if (format === 'obj') {
-      const content = await fs.readFile(outputPath, 'utf-8');
-      const hasVertices = /^v\s+[\d.-]+\s+[\d.-]+\s+[\d.-]+/m.test(content);
+      const head = await readHead(outputPath, 64 * 1024);
+      const hasVertices = /^v\s+[\d.-]+\s+[\d.-]+\s+[\d.-]+/m.test(head.toString('utf-8'));
       if (!hasVertices) {
         console.log(`[Blender] OBJ file has no vertices`);
         return false;
       }
     }
-    
+
     // For STL files, check for facet definitions
     if (format === 'stl') {
-      const content = await fs.readFile(outputPath, 'utf-8');
+      const head = await readHead(outputPath, 64 * 1024);
+      const content = head.toString('utf-8');
       const hasFacets = content.includes('facet normal') || content.includes('endsolid');
-      // Binary STL check
-      const header = await fs.readFile(outputPath);
+      // Binary STL check: 84 bytes = header + zero triangle count
       if (!hasFacets && stat.size === 84) {
         console.log(`[Blender] STL file has no facets`);
         return false;
@@ -122,6 +324,7 @@ async function executeBlender(
     const proc: ChildProcess = spawn('blender', [
       '--background',        // Run without GUI
       '-noaudio',           // Disable audio
+      '--addons', addonsFor(inputFormat, outputFormat).join(','),
       '--python', BLENDER_SCRIPT_PATH
     ], {
       env,
@@ -115,7 +115,13 @@ async function runFreecad(
     });
     
     proc.stderr?.on('data', (data) => {
-      stderr += data.toString();
+      const output = data.toString();
+      stderr += output;
+      // Conversion scripts emit progress on stderr with their own
+      // [FreeCAD] prefix; log those as-is and only tag unprefixed noise
+      output.split('\n').filter(Boolean).forEach((line: string) => {
+        console.log(line.startsWith('[FreeCAD]') ? line : `[FreeCAD] ${line}`);
+      });
     });
     
     proc.on('error', (error) => {
@@ -126,10 +132,6 @@ async function runFreecad(
     proc.on('close', (code) => {
       console.log(`[FreeCAD] Exit code: ${code}`);
       
-      if (stderr) {
-        console.log(`[FreeCAD] stderr: ${stderr}`);
-      }
-      
       if (code !== 0) {
         reject(new ConversionError(
           `FreeCAD conversion failed with exit code ${code}`,
@@ -283,7 +285,13 @@ async function runFreecadScript(
     });
     
     proc.stderr?.on('data', (data) => {
-      stderr += data.toString();
+      const output = data.toString();
+      stderr += output;
+      // Conversion scripts emit progress on stderr with their own
+      // [FreeCAD] prefix; log those as-is and only tag unprefixed noise
+      output.split('\n').filter(Boolean).forEach((line: string) => {
+        console.log(line.startsWith('[FreeCAD]') ? line : `[FreeCAD] ${line}`);
+      });
     });
     
     proc.on('error', (error) => {
@@ -294,10 +302,6 @@ async function runFreecadScript(
     proc.on('close', (code) => {
       console.log(`[FreeCAD] Exit code: ${code}`);
       
-      if (stderr) {
-        console.log(`[FreeCAD] stderr: ${stderr}`);
-      }
-      
       if (code !== 0) {
         reject(new ConversionError(
           `FreeCAD conversion failed with exit code ${code}`,